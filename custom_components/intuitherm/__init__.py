@@ -59,7 +59,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("❌ CRITICAL ERROR in async_setup_entry start: %s", e, exc_info=True)
         return False
 
-    # Get aiohttp session
+    update_interval = timedelta(
+        seconds=config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+    )
+
+    # Get aiohttp session. HA's shared session uses aiohttp's default 15 s
+    # keep-alive, so connections are reused within an update cycle but each
+    # cycle re-opens them; a private session can't keep them warm for a
+    # 15-minute poll without outliving typical proxy idle timeouts
     session = async_get_clientsession(hass)
 
     # Create data coordinator
@@ -68,9 +75,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         session=session,
         service_url=config[CONF_SERVICE_URL],
         api_key=config[CONF_API_KEY],
-        update_interval=timedelta(
-            seconds=config.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-        ),
+        update_interval=update_interval,
         entry=entry,
     )
 
@@ -27,6 +27,7 @@ from .const import (
     CONF_BATTERY_POWER_ENTITY,
     SOLAREDGE_COMMAND_MODE_MAXIMIZE_SELF_CONSUMPTION,
     SOLAREDGE_COMMAND_MODE_CHARGE_FROM_SOLAR_POWER_AND_GRID,
+    ENDPOINT_EXECUTION_FEEDBACK,
 )
 
 if TYPE_CHECKING:
@@ -810,8 +811,9 @@ class BatteryControlExecutor:
             }
             
             response = await self.coordinator._post_json(
-                "/api/v1/control/execution_feedback",
+                ENDPOINT_EXECUTION_FEEDBACK,
                 data=feedback_data,
+                retry=False,  # Feedback drives savings accounting - never apply twice
             )
             
             if response:
@@ -94,6 +94,25 @@ CONF_DRY_RUN_MODE: Final = "dry_run_mode"  # Test mode - MPC runs but doesn't se
 # Default values
 DEFAULT_SERVICE_URL: Final = "https://api.intuihems.de"
 DEFAULT_UPDATE_INTERVAL: Final = 900  # seconds (15 minutes)
+MAX_UPDATE_INTERVAL: Final = 3600  # seconds - upper bound when backend data stays unchanged
+UPDATE_INTERVAL_ON_ERROR: Final = 300  # seconds - faster retry after a failed update
+STALE_CYCLES_BEFORE_BACKOFF: Final = 4  # unchanged update cycles before polling slows down
+SENSOR_READING_HEARTBEAT: Final = 3600  # seconds - resend unchanged sensor values at least this often
+MAX_CONCURRENT_POSTS: Final = 5  # Upper bound for in-flight POST requests to the backend
+SENSOR_QUEUE_MAXSIZE: Final = 100  # Queued sensor readings before the oldest are dropped
+SENSOR_SEND_BATCH_SIZE: Final = 25  # Queued readings drained per sender iteration
+
+# Retry policy for transient backend failures (full-jitter exponential backoff)
+RETRY_MAX_ATTEMPTS: Final = 3
+RETRY_BASE_DELAY: Final = 0.5  # seconds
+RETRY_STATUS_CODES: Final = frozenset({429, 502, 503, 504})
+# Statuses where the backend did not process the request, safe to retry for non-idempotent POSTs
+RETRY_UNPROCESSED_STATUS_CODES: Final = frozenset({429, 503})
+ERROR_BODY_MAX_BYTES: Final = 1024  # Error response bytes kept for logging
+
+# Circuit breaker: stop polling a dead backend after consecutive failed cycles
+CIRCUIT_BREAKER_THRESHOLD: Final = 3  # consecutive failed update cycles
+CIRCUIT_BREAKER_COOLDOWN: Final = 900  # seconds before a single half-open probe
 # Battery executor triggers on-demand refresh before each control execution
 DEFAULT_BATTERY_CAPACITY: Final = 10.0  # kWh
 DEFAULT_BATTERY_MAX_POWER: Final = 3.0  # kW
@@ -114,6 +133,15 @@ ENDPOINT_METRICS: Final = "/api/v1/metrics"
 ENDPOINT_SENSORS: Final = "/api/v1/sensors"
 ENDPOINT_SENSOR_READINGS: Final = "/api/v1/sensors/{sensor_id}/readings"
 ENDPOINT_UPDATE_CONFIG: Final = "/api/v1/config"
+ENDPOINT_SENSOR_DATA: Final = "/api/v1/sensors/data"
+ENDPOINT_CONTROL_PLAN: Final = "/api/v1/control/plan"
+ENDPOINT_EXECUTION_FEEDBACK: Final = "/api/v1/control/execution_feedback"
+ENDPOINT_FORECAST_CONSUMPTION: Final = "/api/v1/forecasts/consumption"
+ENDPOINT_FORECAST_SOLAR: Final = "/api/v1/forecasts/solar"
+ENDPOINT_FORECAST_BATTERY_SOC: Final = "/api/v1/forecasts/battery_soc"
+ENDPOINT_FORECAST_PRICES: Final = "/api/v1/forecasts/prices"
+ENDPOINT_SAVINGS_TODAY: Final = "/api/v1/savings/today"
+ENDPOINT_SAVINGS_OVERALL: Final = "/api/v1/savings/overall"
 
 # Service names
 SERVICE_MANUAL_OVERRIDE: Final = "manual_override"
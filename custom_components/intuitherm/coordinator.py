@@ -2,12 +2,18 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone, timedelta
+import functools
 import logging
+import random
+import time
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
 import numpy as np
+import orjson
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
@@ -21,6 +27,15 @@ from .const import (
     ENDPOINT_CONTROL_DISABLE,
     ENDPOINT_SENSORS,
     ENDPOINT_SENSOR_READINGS,
+    ENDPOINT_SENSOR_DATA,
+    ENDPOINT_CONTROL_PLAN,
+    ENDPOINT_EXECUTION_FEEDBACK,
+    ENDPOINT_FORECAST_CONSUMPTION,
+    ENDPOINT_FORECAST_SOLAR,
+    ENDPOINT_FORECAST_BATTERY_SOC,
+    ENDPOINT_FORECAST_PRICES,
+    ENDPOINT_SAVINGS_TODAY,
+    ENDPOINT_SAVINGS_OVERALL,
     CONF_SOLAR_SENSORS,
     CONF_BATTERY_DISCHARGE_SENSORS,
     CONF_BATTERY_CHARGE_SENSORS,
@@ -30,10 +45,26 @@ from .const import (
     CONF_HOUSE_LOAD_ENTITY,
     CONF_SOLAR_POWER_ENTITY,
     CONF_DETECTED_ENTITIES,
+    SENSOR_READING_HEARTBEAT,
+    MAX_CONCURRENT_POSTS,
+    SENSOR_QUEUE_MAXSIZE,
+    SENSOR_SEND_BATCH_SIZE,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_STATUS_CODES,
+    RETRY_UNPROCESSED_STATUS_CODES,
+    ERROR_BODY_MAX_BYTES,
+    CIRCUIT_BREAKER_THRESHOLD,
+    CIRCUIT_BREAKER_COOLDOWN,
+    MAX_UPDATE_INTERVAL,
+    UPDATE_INTERVAL_ON_ERROR,
+    STALE_CYCLES_BEFORE_BACKOFF,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNAVAILABLE_STATES = ("unknown", "unavailable")
+
 
 class IntuiThermCoordinator(DataUpdateCoordinator):
     """Coordinator to fetch data from IntuiTherm service."""
@@ -53,15 +84,98 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=update_interval,
+            # Only notify entities when the fetched data actually changed
+            always_update=False,
         )
         self.service_url = service_url.rstrip("/")
         self.api_key = api_key
+        # aiohttp speaks HTTP/1.1 only: parallel fetches use pooled keep-alive
+        # connections rather than HTTP/2 multiplexing (see IMPLEMENTATION_GUIDE.md)
         self.session = session
         self.headers = {"Authorization": f"Bearer {api_key}"}
+        # Request headers never change, share read-only views across requests
+        self._headers_frozen = MappingProxyType(self.headers)
+        self._json_headers = MappingProxyType(
+            {**self.headers, "Content-Type": "application/json"}
+        )
+        # Full URLs for all fixed endpoints, built once instead of per request
+        self._urls = {
+            endpoint: f"{self.service_url}{endpoint}"
+            for endpoint in (
+                ENDPOINT_HEALTH,
+                ENDPOINT_CONTROL_STATUS,
+                ENDPOINT_METRICS,
+                ENDPOINT_CONTROL_OVERRIDE,
+                ENDPOINT_CONTROL_ENABLE,
+                ENDPOINT_CONTROL_DISABLE,
+                ENDPOINT_CONTROL_PLAN,
+                ENDPOINT_EXECUTION_FEEDBACK,
+                ENDPOINT_SENSOR_DATA,
+                ENDPOINT_FORECAST_CONSUMPTION,
+                ENDPOINT_FORECAST_SOLAR,
+                ENDPOINT_FORECAST_BATTERY_SOC,
+                ENDPOINT_FORECAST_PRICES,
+                ENDPOINT_SAVINGS_TODAY,
+                ENDPOINT_SAVINGS_OVERALL,
+            )
+        }
         self.entry = entry
+        # Per-request bounds for backend GETs (POSTs pass their own total timeout)
+        self._timeout = aiohttp.ClientTimeout(total=10, connect=3, sock_read=5)
+
+        # Endpoints fetched every update cycle:
+        # (data key, endpoint, query params, log level on failure)
+        fetches = (
+            ("health", ENDPOINT_HEALTH, None, logging.WARNING),
+            ("control", ENDPOINT_CONTROL_STATUS, None, logging.WARNING),
+            ("metrics", ENDPOINT_METRICS, {"period_hours": 1}, logging.WARNING),
+            # Forecast data (may not be available yet for new installations)
+            ("consumption_forecast", ENDPOINT_FORECAST_CONSUMPTION, None, logging.DEBUG),
+            ("solar_forecast", ENDPOINT_FORECAST_SOLAR, None, logging.DEBUG),
+            ("battery_soc_plan", ENDPOINT_FORECAST_BATTERY_SOC, None, logging.DEBUG),
+            ("control_plan", ENDPOINT_CONTROL_PLAN, None, logging.DEBUG),  # Pull-based control plan
+            ("price_forecast", ENDPOINT_FORECAST_PRICES, None, logging.DEBUG),
+            ("savings", ENDPOINT_SAVINGS_TODAY, None, logging.DEBUG),
+            ("savings_overall", ENDPOINT_SAVINGS_OVERALL, None, logging.DEBUG),
+        )
+        # Bind each fetcher to its full URL and params once: (data key, fetcher, log level)
+        self._fetches: tuple[tuple[str, Callable[[], Awaitable[Any]], int], ...] = tuple(
+            (key, functools.partial(self._fetch_url, endpoint, self._urls[endpoint], params), level)
+            for key, endpoint, params, level in fetches
+        )
         self._sensors_registered = False
         self._historic_data_sent = False  # Track if historic backfill completed
-        self._last_sent_values = {}  # Track last sent value per sensor to avoid sending unchanged values
+        # Track last sent (value, monotonic time) per sensor to avoid sending unchanged values
+        self._last_sent_values: dict[str, tuple[float, float]] = {}
+        self._config_cache: dict[str, Any] | None = None  # Merged entry.data + entry.options
+        self._selected_sensors_cache: list[tuple[str, str]] | None = None  # (entity_id, sensor_type)
+        # Cap concurrent POSTs so many sensors can't exhaust the connection pool
+        self._post_sem = asyncio.Semaphore(MAX_CONCURRENT_POSTS)
+        # Circuit breaker state (see _record_cycle_result)
+        self._cb_fail_count = 0
+        self._cb_open_until = 0.0
+        # Adaptive polling: configured interval as base, slower while neither backend
+        # data nor local sensor readings change, since readings are only queued by
+        # update cycles. Time-dependent entities (Next Control) write their own state.
+        self._base_interval = update_interval
+        self._max_interval = max(timedelta(seconds=MAX_UPDATE_INTERVAL), update_interval)
+        self._error_interval = min(timedelta(seconds=UPDATE_INTERVAL_ON_ERROR), update_interval)
+        self._stale_streak = 0
+        self._last_update_failed = False
+
+        # Sensor readings are write-only telemetry: a background worker posts them
+        # so update cycles don't wait on the POSTs. Items are (payload, monotonic time).
+        self._send_queue: asyncio.Queue[tuple[dict[str, Any], float]] = asyncio.Queue(
+            maxsize=SENSOR_QUEUE_MAXSIZE
+        )
+        self._sender_task = hass.async_create_background_task(
+            self._sender_worker(), f"{DOMAIN} sensor reading sender"
+        )
+
+        if entry is not None:
+            # Entry data/options only change on reconfiguration - drop cached config then
+            entry.async_on_unload(entry.add_update_listener(self._async_entry_updated))
+            entry.async_on_unload(self._sender_task.cancel)
 
         _LOGGER.info(
             "IntuiTherm coordinator initialized (service: %s, interval: %s)",
@@ -108,15 +222,128 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
         if seconds_until_next > 0:
             self.update_interval = timedelta(seconds=seconds_until_next)
 
+    async def _async_entry_updated(self, hass: HomeAssistant, entry: Any) -> None:
+        """Invalidate cached configuration when the config entry changes."""
+        self._config_cache = None
+        self._selected_sensors_cache = None
+
+    def _get_config(self) -> dict[str, Any]:
+        """Return merged entry.data and entry.options (options take precedence)."""
+        if self._config_cache is None:
+            self._config_cache = {**self.entry.data, **self.entry.options}
+        return self._config_cache
+
+    def _get_selected_sensors(self) -> list[tuple[str, str]]:
+        """Return (entity_id, sensor_type) pairs of the user's selected sensors."""
+        if self._selected_sensors_cache is not None:
+            return self._selected_sensors_cache
+
+        # Get SELECTED entities from config (not all detected)
+        # These are the user's final selections from the setup flow
+        detected = self._get_config().get(CONF_DETECTED_ENTITIES, {})
+        
+        # Build list of selected sensors only
+        selected_sensors = []
+        
+        # Solar power (single selected entity)
+        if solar_power := detected.get(CONF_SOLAR_POWER_ENTITY):
+            selected_sensors.append((solar_power, "solar"))
+        
+        # Battery SOC (single selected entity)
+        if battery_soc := detected.get(CONF_BATTERY_SOC_ENTITY):
+            selected_sensors.append((battery_soc, "soc"))
+        
+        # House load (single selected entity)
+        if house_load := detected.get(CONF_HOUSE_LOAD_ENTITY):
+            selected_sensors.append((house_load, "load"))
+        
+        # Battery charge/discharge (arrays of selected entities)
+        for entity_id in detected.get(CONF_BATTERY_CHARGE_SENSORS, []):
+            selected_sensors.append((entity_id, "battery_charge"))
+        
+        for entity_id in detected.get(CONF_BATTERY_DISCHARGE_SENSORS, []):
+            selected_sensors.append((entity_id, "battery_discharge"))
+        
+        for entity_id in detected.get(CONF_GRID_IMPORT_SENSORS, []):
+            selected_sensors.append((entity_id, "grid_import"))
+        
+        for entity_id in detected.get(CONF_GRID_EXPORT_SENSORS, []):
+            selected_sensors.append((entity_id, "grid_export"))
+
+        self._selected_sensors_cache = selected_sensors
+        return selected_sensors
+
+    def _record_cycle_result(self, success: bool) -> None:
+        """Track consecutive failed update cycles and open the circuit breaker."""
+        if success:
+            if self._cb_fail_count >= CIRCUIT_BREAKER_THRESHOLD:
+                _LOGGER.info("✅ Backend reachable again, closing circuit breaker")
+            self._cb_fail_count = 0
+            self._cb_open_until = 0.0
+            return
+
+        self._cb_fail_count += 1
+        if self._cb_fail_count >= CIRCUIT_BREAKER_THRESHOLD:
+            self._cb_open_until = self.hass.loop.time() + CIRCUIT_BREAKER_COOLDOWN
+            _LOGGER.warning(
+                "🚫 Backend failed %d update cycles in a row, pausing requests for %ds",
+                self._cb_fail_count,
+                CIRCUIT_BREAKER_COOLDOWN,
+            )
+
+    def _adapt_update_interval(self, failed: bool, changed: bool = True) -> None:
+        """Pick the next update interval from the outcome of this cycle.
+
+        Failures retry after UPDATE_INTERVAL_ON_ERROR (at most the configured
+        interval). A cycle counts as changed when the backend data changed or
+        new sensor readings were queued; only unchanged cycles double the
+        configured interval up to MAX_UPDATE_INTERVAL.
+        """
+        if failed:
+            self._stale_streak = 0
+            self._last_update_failed = True
+            self.update_interval = self._error_interval
+            return
+
+        if self._last_update_failed:
+            # Recovered from a failure - re-align to the quarter-hour schedule
+            self._last_update_failed = False
+            self._stale_streak = 0
+            self.update_interval = self._base_interval
+            self._align_to_quarter_hour()
+            return
+
+        if changed:
+            self._stale_streak = 0
+            self.update_interval = self._base_interval
+            return
+
+        self._stale_streak += 1
+        if self._stale_streak < STALE_CYCLES_BEFORE_BACKOFF:
+            self.update_interval = self._base_interval
+            return
+
+        current = max(self.update_interval, self._base_interval)
+        new_interval = min(self._max_interval, current * 2)
+        if new_interval != self.update_interval:
+            _LOGGER.debug(
+                "Backend data and sensor readings unchanged for %d cycles, update interval now %s",
+                self._stale_streak,
+                new_interval,
+            )
+        self.update_interval = new_interval
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from IntuiTherm service."""
         _LOGGER.info("🔄 Coordinator update cycle started")
-        
-        # After first aligned update, reset to 15-minute intervals
-        # This keeps updates at :00, :15, :30, :45
-        if self.update_interval.total_seconds() != 900:
-            self.update_interval = timedelta(seconds=900)
-            _LOGGER.debug("Update interval reset to 15 minutes")
+
+        # One wall-clock read per cycle, shared by sensor readings and last_update
+        cycle_timestamp = datetime.now(timezone.utc).isoformat()
+
+        # Circuit open: skip all I/O until the cool-down ends. The first cycle
+        # after it acts as a half-open probe and re-opens the circuit on failure.
+        if self.hass.loop.time() < self._cb_open_until:
+            raise UpdateFailed("Circuit open - backend unavailable, skipping requests")
 
         try:
             # Register sensors on first run
@@ -133,111 +360,134 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
                 # Run backfill in background task so it doesn't block setup
                 self.hass.async_create_task(self._backfill_historic_data_background())
 
-            # Send sensor readings
-            if self.entry:
-                _LOGGER.info("📊 Sending current sensor readings...")
-                await self._send_sensor_readings()
-                _LOGGER.info("✅ Sensor readings sent")
+            # Queue sensor readings for the background sender (non-blocking).
+            # Skip entirely when no sensors are selected (common during initial setup);
+            # the selection is cached and invalidated on config entry updates
+            readings_queued = 0
+            if self.entry and self._get_selected_sensors():
+                _LOGGER.info("📊 Queueing current sensor readings...")
+                readings_queued = self._queue_sensor_readings(cycle_timestamp)
 
-            try:
-                async with asyncio.timeout(15):
-                    _LOGGER.info("🌐 Fetching backend data...")
-                    # Fetch all endpoints in parallel for efficiency
-                    health_task = self._fetch_json(ENDPOINT_HEALTH)
-                    status_task = self._fetch_json(ENDPOINT_CONTROL_STATUS)
-                    metrics_task = self._fetch_json(ENDPOINT_METRICS, params={"period_hours": 1})
-                    
-                    # Fetch forecast data
-                    consumption_forecast_task = self._fetch_json("/api/v1/forecasts/consumption")
-                    solar_forecast_task = self._fetch_json("/api/v1/forecasts/solar")
-                    battery_soc_plan_task = self._fetch_json("/api/v1/forecasts/battery_soc")
-                    control_plan_task = self._fetch_json("/api/v1/control/plan")  # Pull-based control plan
-                    price_forecast_task = self._fetch_json("/api/v1/forecasts/prices")
-                    savings_task = self._fetch_json("/api/v1/savings/today")
-                    savings_overall_task = self._fetch_json("/api/v1/savings/overall")
-
-                    health, status, metrics, consumption_forecast, solar_forecast, \
-                    battery_soc_plan, control_plan, price_forecast, savings, savings_overall = await asyncio.gather(
-                        health_task,
-                        status_task,
-                        metrics_task,
-                        consumption_forecast_task,
-                        solar_forecast_task,
-                        battery_soc_plan_task,
-                        control_plan_task,
-                        price_forecast_task,
-                        savings_task,
-                        savings_overall_task,
-                        return_exceptions=True,
-                    )
-                    _LOGGER.info("✅ Backend data fetched successfully")
-            except (asyncio.TimeoutError, asyncio.CancelledError) as err:
-                _LOGGER.warning("⏱️ Backend data fetch timed out or was cancelled: %s", err)
-                # Return partial data with None values for missing data
-                health = status = metrics = None
-                consumption_forecast = solar_forecast = battery_soc_plan = None
-                control_plan = price_forecast = savings = savings_overall = None
-
-            # Build response, handling individual failures gracefully
-            data = {
-                "last_update": datetime.now(timezone.utc).isoformat(),
-            }
+            _LOGGER.info("🌐 Fetching backend data...")
+            # _fetch_or_none never raises, so one failing endpoint doesn't cancel
+            # the rest of the task group. Each GET is bounded by self._timeout.
+            async with asyncio.TaskGroup() as tg:
+                # Fetch all endpoints in parallel for efficiency
+                tasks = {
+                    key: tg.create_task(self._fetch_or_none(key, fetcher, level))
+                    for key, fetcher, level in self._fetches
+                }
+            _LOGGER.info("✅ Backend data fetched successfully")
 
-            if isinstance(health, Exception):
-                _LOGGER.warning("Failed to fetch health: %s", health)
-                data["health"] = None
-            else:
-                data["health"] = health
+            # Build response, individual failures (including timeouts) are already None
+            data = {key: task.result() for key, task in tasks.items()}
 
-            if isinstance(status, Exception):
-                _LOGGER.warning("Failed to fetch control status: %s", status)
-                data["control"] = None
-            else:
-                data["control"] = status
+            data["battery_soc_forecast"] = data["battery_soc_plan"]
 
-            if isinstance(metrics, Exception):
-                _LOGGER.warning("Failed to fetch metrics: %s", metrics)
-                data["metrics"] = None
+            # Keep last_update stable while the payload is unchanged so the
+            # coordinator can skip notifying entities (always_update=False)
+            previous = self.data or {}
+            unchanged = bool(previous) and all(
+                previous.get(key) == value for key, value in data.items()
+            )
+            if unchanged:
+                data["last_update"] = previous.get("last_update")
             else:
-                data["metrics"] = metrics
-                
-            # Add forecast data
-            data["consumption_forecast"] = consumption_forecast if not isinstance(consumption_forecast, Exception) else None
-            data["solar_forecast"] = solar_forecast if not isinstance(solar_forecast, Exception) else None
-            data["battery_soc_plan"] = battery_soc_plan if not isinstance(battery_soc_plan, Exception) else None
-            data["battery_soc_forecast"] = battery_soc_plan if not isinstance(battery_soc_plan, Exception) else None
-            data["control_plan"] = control_plan if not isinstance(control_plan, Exception) else None
-            data["price_forecast"] = price_forecast if not isinstance(price_forecast, Exception) else None
-            data["savings"] = savings if not isinstance(savings, Exception) else None
-            data["savings_overall"] = savings_overall if not isinstance(savings_overall, Exception) else None
-            
-            if isinstance(consumption_forecast, Exception):
-                _LOGGER.debug("No consumption forecast available yet: %s", consumption_forecast)
-            if isinstance(solar_forecast, Exception):
-                _LOGGER.debug("No solar forecast available yet: %s", solar_forecast)
+                data["last_update"] = cycle_timestamp
+
+            # A cycle where no backend request succeeded counts as a failure
+            success = any(data[key] is not None for key, _, _ in self._fetches)
+            self._record_cycle_result(success)
+
+            # With the default 15-minute interval this keeps updates at :00, :15, :30, :45.
+            # Changing local sensors keep the base interval so telemetry isn't throttled
+            self._adapt_update_interval(
+                failed=not success, changed=not unchanged or readings_queued > 0
+            )
 
             _LOGGER.info("🎉 Coordinator update cycle complete")
             return data
 
         except asyncio.TimeoutError as err:
             _LOGGER.error("⏱️ Timeout fetching data from service: %s", err)
+            self._record_cycle_result(False)
+            self._adapt_update_interval(failed=True)
             raise UpdateFailed(f"Timeout fetching data from service: {err}") from err
         except Exception as err:
             _LOGGER.error("❌ Error communicating with service: %s", err)
+            self._record_cycle_result(False)
+            self._adapt_update_interval(failed=True)
             raise UpdateFailed(f"Error communicating with service: {err}") from err
 
-    async def _fetch_json(
-        self, endpoint: str, params: dict[str, Any] | None = None
-    ) -> dict[str, Any]:
-        """Fetch JSON data from an endpoint."""
-        url = f"{self.service_url}{endpoint}"
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        *,
+        retry: bool = True,
+        idempotent: bool = True,
+        headers: MappingProxyType[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Send a request and return its JSON body, retrying transient failures.
 
+        Connection errors, timeouts and 429/502/503/504 responses are retried
+        with full-jitter exponential backoff. With idempotent=False only failures
+        where the backend never processed the request (failed connect, 429/503)
+        are retried. Other HTTP errors raise immediately and carry the start of
+        the response body as ``body_snippet``.
+        """
+        attempts = RETRY_MAX_ATTEMPTS if retry else 1
+        if idempotent:
+            retry_statuses = RETRY_STATUS_CODES
+            retry_errors: tuple[type[Exception], ...] = (
+                aiohttp.ClientConnectionError,
+                asyncio.TimeoutError,
+            )
+        else:
+            retry_statuses = RETRY_UNPROCESSED_STATUS_CODES
+            retry_errors = (aiohttp.ClientConnectorError,)
+
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                async with self.session.request(
+                    method, url, headers=headers or self._headers_frozen, **kwargs
+                ) as response:
+                    if response.status not in retry_statuses or last_attempt:
+                        if response.status >= 400:
+                            # Keep a bounded snippet of the error body while the
+                            # response is still open; it is exposed on the error
+                            snippet = await response.content.read(ERROR_BODY_MAX_BYTES)
+                            try:
+                                response.raise_for_status()
+                            except aiohttp.ClientResponseError as err:
+                                err.body_snippet = snippet.decode("utf-8", "replace")
+                                raise
+                        # Parse raw bytes with orjson (empty body -> None, like response.json())
+                        body = await response.read()
+                        return orjson.loads(body) if body.strip() else None
+                    reason = f"HTTP {response.status}"
+            except retry_errors as err:
+                if last_attempt:
+                    raise
+                reason = repr(err)
+
+            delay = random.uniform(0, RETRY_BASE_DELAY * 2**attempt)
+            _LOGGER.debug(
+                "%s %s failed (%s), retrying in %.2fs (attempt %d/%d)",
+                method, url, reason, delay, attempt + 1, attempts,
+            )
+            await asyncio.sleep(delay)
+
+    async def _fetch_url(
+        self, endpoint: str, url: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Fetch JSON data from an already resolved endpoint URL."""
         try:
-            async with self.session.get(
-                url, headers=self.headers, params=params
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+            return await self._request_with_retry(
+                "GET", url, params=params, timeout=self._timeout
+            )
 
         except aiohttp.ClientResponseError as err:
             if err.status == 401:
@@ -252,21 +502,44 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Unexpected error fetching %s: %s", endpoint, err)
             raise
 
+    async def _fetch_or_none(
+        self,
+        name: str,
+        fetcher: Callable[[], Awaitable[Any]],
+        log_level: int = logging.WARNING,
+    ) -> dict[str, Any] | None:
+        """Run a bound fetcher, returning None on failure."""
+        try:
+            return await fetcher()
+        except Exception as err:
+            _LOGGER.log(log_level, "Failed to fetch %s: %s", name, err)
+            return None
+
     async def _post_json(
         self,
         endpoint: str,
         data: dict[str, Any] | None = None,
         timeout: int = 30,
+        retry: bool = True,
+        idempotent: bool = True,
     ) -> dict[str, Any]:
-        """Post JSON data to an endpoint."""
-        url = f"{self.service_url}{endpoint}"
+        """Post JSON data to an endpoint.
+
+        Pass retry=False for requests that must not be applied twice, or
+        idempotent=False to only retry requests the backend never processed.
+        """
+        url = self._urls.get(endpoint) or f"{self.service_url}{endpoint}"
 
         try:
-            async with self.session.post(
-                url, headers=self.headers, json=data, timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+            return await self._request_with_retry(
+                "POST",
+                url,
+                retry=retry,
+                idempotent=idempotent,
+                headers=self._json_headers,
+                data=orjson.dumps(data) if data is not None else None,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            )
 
         except aiohttp.ClientResponseError as err:
             if err.status == 401:
@@ -274,7 +547,11 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
                     "Authentication failed for %s - check API key", endpoint
                 )
             elif err.status == 400:
-                _LOGGER.error("Bad request to %s: %s", endpoint, await response.text())
+                _LOGGER.error(
+                    "Bad request to %s: %s",
+                    endpoint,
+                    getattr(err, "body_snippet", None) or err.message,
+                )
             raise
         except aiohttp.ClientError as err:
             _LOGGER.error("HTTP error posting to %s: %s", endpoint, err)
@@ -283,6 +560,16 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Unexpected error posting to %s: %s", endpoint, err)
             raise
 
+    async def _post_json_limited(
+        self,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        idempotent: bool = True,
+    ) -> dict[str, Any]:
+        """Post JSON data to an endpoint, bounded by the POST concurrency limit."""
+        async with self._post_sem:
+            return await self._post_json(endpoint, data=data, idempotent=idempotent)
+
     async def async_manual_override(
         self,
         action: str,
@@ -304,7 +591,7 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
             payload["duration_minutes"] = duration_minutes
 
         try:
-            result = await self._post_json(ENDPOINT_CONTROL_OVERRIDE, data=payload)
+            result = await self._post_json_limited(ENDPOINT_CONTROL_OVERRIDE, data=payload)
             _LOGGER.info("Manual override successful: %s", result.get("message"))
             return result
         except Exception as err:
@@ -316,7 +603,7 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
         _LOGGER.info("Enabling automatic control")
 
         try:
-            result = await self._post_json(ENDPOINT_CONTROL_ENABLE)
+            result = await self._post_json_limited(ENDPOINT_CONTROL_ENABLE)
             _LOGGER.info("Automatic control enabled: %s", result.get("message"))
             return result
         except Exception as err:
@@ -328,7 +615,7 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
         _LOGGER.info("Disabling automatic control")
 
         try:
-            result = await self._post_json(ENDPOINT_CONTROL_DISABLE)
+            result = await self._post_json_limited(ENDPOINT_CONTROL_DISABLE)
             _LOGGER.info("Automatic control disabled: %s", result.get("message"))
             return result
         except Exception as err:
@@ -340,116 +627,152 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
         if not self.entry:
             return
 
-        config = {**self.entry.data, **self.entry.options}
-        
         # Note: Backend uses /sensors/data endpoint, so we don't need explicit registration
         # Sensors are auto-created when first data is sent
         _LOGGER.info("Sensors will be auto-registered on first data send")
         
-    async def _send_sensor_readings(self) -> None:
-        """Send current sensor readings to the backend."""
+    def _queue_sensor_readings(self, timestamp: str) -> int:
+        """Queue current sensor readings for the background sender.
+
+        All readings share the given ISO 8601 timestamp of the update cycle.
+        Returns the number of readings queued.
+        """
         if not self.entry:
-            return
+            return 0
 
-        config = {**self.entry.data, **self.entry.options}
-        
-        # Get SELECTED entities from config (not all detected)
-        # These are the user's final selections from the setup flow
-        detected = config.get(CONF_DETECTED_ENTITIES, {})
-        
-        # Build list of selected sensors only
-        selected_sensors = []
-        
-        # Solar power (single selected entity)
-        if solar_power := detected.get(CONF_SOLAR_POWER_ENTITY):
-            selected_sensors.append((solar_power, "solar"))
-        
-        # Battery SOC (single selected entity)
-        if battery_soc := detected.get(CONF_BATTERY_SOC_ENTITY):
-            selected_sensors.append((battery_soc, "soc"))
-        
-        # House load (single selected entity)
-        if house_load := detected.get(CONF_HOUSE_LOAD_ENTITY):
-            selected_sensors.append((house_load, "load"))
-        
-        # Battery charge/discharge (arrays of selected entities)
-        for entity_id in detected.get(CONF_BATTERY_CHARGE_SENSORS, []):
-            selected_sensors.append((entity_id, "battery_charge"))
-        
-        for entity_id in detected.get(CONF_BATTERY_DISCHARGE_SENSORS, []):
-            selected_sensors.append((entity_id, "battery_discharge"))
-        
-        for entity_id in detected.get(CONF_GRID_IMPORT_SENSORS, []):
-            selected_sensors.append((entity_id, "grid_import"))
-        
-        for entity_id in detected.get(CONF_GRID_EXPORT_SENSORS, []):
-            selected_sensors.append((entity_id, "grid_export"))
-        
-        _LOGGER.debug("📋 Sending data for %d selected sensors", len(selected_sensors))
+        selected_sensors = self._get_selected_sensors()
+        _LOGGER.debug("📋 Queueing data for %d selected sensors", len(selected_sensors))
 
-        # Send data for each selected sensor
-        sensors_sent = 0
-        sensors_skipped = 0
+        now = time.monotonic()
+
+        # Resolve all states up front (local binding avoids repeated attribute
+        # lookups through hass.states), then parse values in a tight loop
+        states_get = self.hass.states.get
+        entries = []
         for entity_id, sensor_type in selected_sensors:
-            state = self.hass.states.get(entity_id)
-            if state and state.state not in ("unknown", "unavailable"):
-                try:
-                    value = float(state.state)
-                    
-                    # Only send if value has changed since last update
-                    last_value = self._last_sent_values.get(entity_id)
-                    if last_value is not None and abs(value - last_value) < 0.001:
-                        sensors_skipped += 1
-                        _LOGGER.debug("⏭️ Skipping %s: value unchanged (%.3f)", entity_id, value)
-                        continue
-                    
-                    timestamp = datetime.now(timezone.utc)
-                    
-                    # Determine if sensor is cumulative based on attributes
-                    attributes = state.attributes
-                    unit = attributes.get("unit_of_measurement")
-                    device_class = attributes.get("device_class")
-                    state_class = attributes.get("state_class")
-                    
-                    # Logic matches config_flow.py _classify_sensor
-                    is_cumulative = (
-                        (unit and unit.lower() in ["kwh", "wh", "mwh"]) or
-                        device_class == "energy" or
-                        state_class == "total_increasing"
-                    )
+            state = states_get(entity_id)
+            if state is None:
+                _LOGGER.warning("❌ Sensor not found: %s", entity_id)
+            elif state.state in _UNAVAILABLE_STATES:
+                _LOGGER.debug("⏭️ Skipping %s: state=%s", entity_id, state.state)
+            else:
+                entries.append((entity_id, state, sensor_type))
+
+        # Collect one payload per selected sensor (backend schema carries unit and
+        # is_cumulative per entity), then queue them after the state scan
+        last_sent_values = self._last_sent_values
+        payloads = []
+        sensors_skipped = 0
+        for entity_id, state, sensor_type in entries:
+            try:
+                value = float(state.state)
+            except (ValueError, TypeError) as err:
+                _LOGGER.warning("⚠️ Could not parse value for %s: %s (state=%s)", entity_id, err, state.state)
+                continue
+
+            # Only send if value has changed since last update, but still
+            # resend unchanged values periodically as a heartbeat
+            last_sent = last_sent_values.get(entity_id)
+            if (
+                last_sent is not None
+                and abs(value - last_sent[0]) < 0.001
+                and now - last_sent[1] < SENSOR_READING_HEARTBEAT
+            ):
+                sensors_skipped += 1
+                _LOGGER.debug("⏭️ Skipping %s: value unchanged (%.3f)", entity_id, value)
+                continue
 
-                    # Send to backend using /sensors/data endpoint
-                    await self._post_json(
-                        "/api/v1/sensors/data",
-                        data={
-                            "sensor_type": sensor_type,
-                            "entity_id": entity_id,
-                            "readings": [
-                                {
-                                    "timestamp": timestamp.isoformat(),
-                                    "value": value,
-                                }
-                            ],
-                            "unit": unit,
-                            "is_cumulative": is_cumulative,
+            # Determine if sensor is cumulative based on attributes
+            attributes = state.attributes
+            unit = attributes.get("unit_of_measurement")
+            device_class = attributes.get("device_class")
+            state_class = attributes.get("state_class")
+
+            # Logic matches config_flow.py _classify_sensor
+            is_cumulative = (
+                (unit and unit.lower() in ["kwh", "wh", "mwh"]) or
+                device_class == "energy" or
+                state_class == "total_increasing"
+            )
+
+            payloads.append(
+                {
+                    "sensor_type": sensor_type,
+                    "entity_id": entity_id,
+                    "readings": [
+                        {
+                            "timestamp": timestamp,
+                            "value": value,
                         }
-                    )
-                    
-                    # Update last sent value
-                    self._last_sent_values[entity_id] = value
-                    sensors_sent += 1
-                    _LOGGER.debug("✓ Sent %s reading for %s: %s", sensor_type, entity_id, value)
-                except (ValueError, TypeError) as err:
-                    _LOGGER.warning("⚠️ Could not parse value for %s: %s (state=%s)", entity_id, err, state.state)
-                except Exception as err:
-                    _LOGGER.warning("⚠️ Failed to send reading for %s: %s", entity_id, err)
+                    ],
+                    "unit": unit,
+                    "is_cumulative": is_cumulative,
+                }
+            )
+
+        for payload in payloads:
+            if self._send_queue.full():
+                # Drop the oldest reading rather than blocking the update cycle
+                dropped, _ = self._send_queue.get_nowait()
+                _LOGGER.warning("⚠️ Sensor reading queue full, dropping oldest reading for %s", dropped["entity_id"])
+            self._send_queue.put_nowait((payload, now))
+
+        _LOGGER.info("📤 Queued %d sensor readings (skipped %d unchanged)", len(payloads), sensors_skipped)
+        return len(payloads)
+
+    async def _sender_worker(self) -> None:
+        """Drain queued sensor readings and post them to the backend."""
+        while True:
+            items = [await self._send_queue.get()]
+            while len(items) < SENSOR_SEND_BATCH_SIZE and not self._send_queue.empty():
+                items.append(self._send_queue.get_nowait())
+
+            try:
+                await self._send_sensor_readings(items)
+            except Exception as err:
+                _LOGGER.warning("⚠️ Failed to send sensor readings: %s", err)
+
+    async def _send_sensor_readings(
+        self, items: list[tuple[dict[str, Any], float]]
+    ) -> None:
+        """Send queued sensor readings, one POST per entity."""
+        # Merge queued readings of the same entity into a single payload
+        payloads: dict[str, dict[str, Any]] = {}
+        last_values: dict[str, tuple[float, float]] = {}
+        for payload, queued_at in items:
+            entity_id = payload["entity_id"]
+            if (merged := payloads.get(entity_id)) is None:
+                payloads[entity_id] = {**payload, "readings": list(payload["readings"])}
             else:
-                if state:
-                    _LOGGER.debug("⏭️ Skipping %s: state=%s", entity_id, state.state)
-                else:
-                    _LOGGER.warning("❌ Sensor not found: %s", entity_id)
-        
-        _LOGGER.info("📤 Sent %d sensor readings (skipped %d unchanged)", sensors_sent, sensors_skipped)
+                merged["readings"].extend(payload["readings"])
+            last_values[entity_id] = (payload["readings"][-1]["value"], queued_at)
+
+        # Send to backend using /sensors/data endpoint (in parallel, bounded by _post_sem).
+        # A timed-out insert may still have been stored, so don't resend it
+        tasks = [
+            self._post_json_limited(ENDPOINT_SENSOR_DATA, data=payload, idempotent=False)
+            for payload in payloads.values()
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        sensors_sent = 0
+        for (entity_id, payload), result in zip(payloads.items(), results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("⚠️ Failed to send reading for %s: %s", entity_id, result)
+                continue
+
+            # Update last sent value
+            self._last_sent_values[entity_id] = last_values[entity_id]
+            sensors_sent += 1
+            _LOGGER.debug(
+                "✓ Sent %d %s reading(s) for %s: %s",
+                len(payload["readings"]),
+                payload["sensor_type"],
+                entity_id,
+                last_values[entity_id][0],
+            )
+
+        _LOGGER.info("📤 Sent readings for %d sensors", sensors_sent)
 
     async def _backfill_historic_data_background(self) -> None:
         """Background task wrapper for historic data backfill."""
@@ -546,7 +869,7 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
                 _LOGGER.warning("Recorder not available, skipping historic backfill")
                 return False
             
-            config = {**self.entry.data, **self.entry.options}
+            config = self._get_config()
             
             # Get detected entities (sensors are stored under this key)
             detected = config.get(CONF_DETECTED_ENTITIES, {})
@@ -718,7 +1041,7 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
                     try:
                         _LOGGER.debug("Sending batch %d-%d for %s...", i+1, i+len(batch), entity_id)
                         await self._post_json(
-                            "/api/v1/sensors/data",
+                            ENDPOINT_SENSOR_DATA,
                             data={
                                 "sensor_type": sensor_type,
                                 "entity_id": entity_id,
@@ -727,6 +1050,9 @@ class IntuiThermCoordinator(DataUpdateCoordinator):
                                 "is_cumulative": is_cumulative,
                             },
                             timeout=90,  # 90 second timeout
+                            # A slow insert is usually still running - resending
+                            # would duplicate readings and stall the backfill
+                            retry=False,
                         )
                         total_readings += len(batch)
                         _LOGGER.debug("✓ Sent batch %d-%d for %s", i+1, i+len(batch), entity_id)
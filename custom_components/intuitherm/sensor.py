@@ -1,7 +1,7 @@
 """Sensor platform for IntuiTherm integration."""
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 from typing import Any
 
@@ -12,8 +12,9 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
@@ -658,6 +659,64 @@ class IntuiThermNextControlSensor(IntuiThermSensorBase):
             "Next Control",
             "mdi:chart-timeline-variant",
         )
+        self._cancel_timer = None
+
+    async def async_added_to_hass(self) -> None:
+        """Schedule the first time-based state write."""
+        await super().async_added_to_hass()
+        self._schedule_next_write()
+        self.async_on_remove(self._cancel_next_write)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Reschedule the time-based state write for the new plan."""
+        self._schedule_next_write()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _cancel_next_write(self) -> None:
+        """Cancel the pending time-based state write."""
+        if self._cancel_timer:
+            self._cancel_timer()
+            self._cancel_timer = None
+
+    @callback
+    def _schedule_next_write(self) -> None:
+        """Write state again once the current next control is in the past.
+
+        The coordinator only notifies entities when its data changes, but this
+        sensor's state depends on the current time as well.
+        """
+        self._cancel_next_write()
+
+        control_data = self.coordinator.data.get("control_plan") if self.coordinator.data else None
+        if not control_data or isinstance(control_data, Exception):
+            return
+
+        from homeassistant.util import dt as dt_util
+        now = dt_util.now()
+
+        for control in control_data.get("controls", []):
+            try:
+                timestamp_str = control.get("target_timestamp")
+                if timestamp_str:
+                    control_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+                    if control_time >= now:
+                        self._cancel_timer = async_track_point_in_time(
+                            self.hass,
+                            self._next_write_callback,
+                            control_time + timedelta(seconds=1),
+                        )
+                        return
+            except (ValueError, TypeError, AttributeError):
+                continue
+
+    @callback
+    def _next_write_callback(self, now: datetime) -> None:
+        """Advance to the following control and write the new state."""
+        self._cancel_timer = None
+        self._schedule_next_write()
+        self.async_write_ha_state()
 
     @property
     def native_value(self) -> str | None: